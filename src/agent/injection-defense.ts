@@ -30,7 +30,10 @@ const RATE_LIMIT_SWEEP_INTERVAL = 100;
 function sweepExpiredEntries(): void {
   const now = Date.now();
   for (const [key, timestamps] of rateLimitMap) {
-    if (timestamps.every((t) => now - t >= RATE_LIMIT_WINDOW_MS)) {
+    // Timestamps are appended in order, so the entry is dead iff its
+    // newest timestamp is outside the window.
+    const newest = timestamps[timestamps.length - 1];
+    if (newest === undefined || now - newest >= RATE_LIMIT_WINDOW_MS) {
       rateLimitMap.delete(key);
     }
   }
@@ -38,10 +41,21 @@ function sweepExpiredEntries(): void {
 
 function checkRateLimit(source: string): boolean {
   const now = Date.now();
-  const timestamps = rateLimitMap.get(source) || [];
-  const recent = timestamps.filter((t) => now - t < RATE_LIMIT_WINDOW_MS);
-  recent.push(now);
-  rateLimitMap.set(source, recent);
+  let timestamps = rateLimitMap.get(source);
+  if (!timestamps) {
+    timestamps = [];
+    rateLimitMap.set(source, timestamps);
+  }
+  // Expired timestamps form a prefix of the (append-ordered) array;
+  // drop them in place rather than allocating a filtered copy per call.
+  let expired = 0;
+  while (expired < timestamps.length && now - timestamps[expired] >= RATE_LIMIT_WINDOW_MS) {
+    expired++;
+  }
+  if (expired > 0) {
+    timestamps.splice(0, expired);
+  }
+  timestamps.push(now);
 
   // Periodically sweep expired entries to prevent unbounded map growth
   rateLimitCallCount++;
@@ -50,7 +64,7 @@ function checkRateLimit(source: string): boolean {
     sweepExpiredEntries();
   }
 
-  return recent.length > RATE_LIMIT_MAX;
+  return timestamps.length > RATE_LIMIT_MAX;
 }
 
 /** Exposed for testing: reset rate limit state. */
@@ -240,28 +254,31 @@ export function sanitizeInput(
 }
 
 // ─── Detection Functions ──────────────────────────────────────
+//
+// Pattern tables live at module level so they are built (and the
+// regexes compiled) once at import, not on every message scanned.
+
+const INSTRUCTION_PATTERNS = [
+  /you\s+must\s+(now\s+)?/i,
+  /ignore\s+(all\s+)?(previous|prior|above)/i,
+  /disregard\s+(all\s+)?(previous|prior|above)/i,
+  /forget\s+(everything|all|your)/i,
+  /new\s+instructions?:/i,
+  /system\s*:\s*/i,
+  /\[INST\]/i,
+  /\[\/INST\]/i,
+  /<<SYS>>/i,
+  /<<\/SYS>>/i,
+  /^(assistant|system|user)\s*:/im,
+  /override\s+(all\s+)?safety/i,
+  /bypass\s+(all\s+)?restrictions?/i,
+  /execute\s+the\s+following/i,
+  /run\s+this\s+command/i,
+  /your\s+real\s+instructions?\s+(are|is)/i,
+];
 
 function detectInstructionPatterns(text: string): InjectionCheck {
-  const patterns = [
-    /you\s+must\s+(now\s+)?/i,
-    /ignore\s+(all\s+)?(previous|prior|above)/i,
-    /disregard\s+(all\s+)?(previous|prior|above)/i,
-    /forget\s+(everything|all|your)/i,
-    /new\s+instructions?:/i,
-    /system\s*:\s*/i,
-    /\[INST\]/i,
-    /\[\/INST\]/i,
-    /<<SYS>>/i,
-    /<<\/SYS>>/i,
-    /^(assistant|system|user)\s*:/im,
-    /override\s+(all\s+)?safety/i,
-    /bypass\s+(all\s+)?restrictions?/i,
-    /execute\s+the\s+following/i,
-    /run\s+this\s+command/i,
-    /your\s+real\s+instructions?\s+(are|is)/i,
-  ];
-
-  const detected = patterns.some((p) => p.test(text));
+  const detected = INSTRUCTION_PATTERNS.some((p) => p.test(text));
   return {
     name: "instruction_patterns",
     detected,
@@ -271,20 +288,20 @@ function detectInstructionPatterns(text: string): InjectionCheck {
   };
 }
 
-function detectAuthorityClaims(text: string): InjectionCheck {
-  const patterns = [
-    /i\s+am\s+(your\s+)?(creator|admin|owner|developer|god)/i,
-    /this\s+is\s+(an?\s+)?(system|admin|emergency)\s+(message|override|update)/i,
-    /authorized\s+by\s+(the\s+)?(admin|system|creator)/i,
-    /i\s+have\s+(admin|root|full)\s+(access|permission|authority)/i,
-    /emergency\s+protocol/i,
-    /developer\s+mode/i,
-    /admin\s+override/i,
-    /from\s+anthropic/i,
-    /from\s+conway\s+(team|admin|staff)/i,
-  ];
+const AUTHORITY_CLAIM_PATTERNS = [
+  /i\s+am\s+(your\s+)?(creator|admin|owner|developer|god)/i,
+  /this\s+is\s+(an?\s+)?(system|admin|emergency)\s+(message|override|update)/i,
+  /authorized\s+by\s+(the\s+)?(admin|system|creator)/i,
+  /i\s+have\s+(admin|root|full)\s+(access|permission|authority)/i,
+  /emergency\s+protocol/i,
+  /developer\s+mode/i,
+  /admin\s+override/i,
+  /from\s+anthropic/i,
+  /from\s+conway\s+(team|admin|staff)/i,
+];
 
-  const detected = patterns.some((p) => p.test(text));
+function detectAuthorityClaims(text: string): InjectionCheck {
+  const detected = AUTHORITY_CLAIM_PATTERNS.some((p) => p.test(text));
   return {
     name: "authority_claims",
     detected,
@@ -294,24 +311,24 @@ function detectAuthorityClaims(text: string): InjectionCheck {
   };
 }
 
-function detectBoundaryManipulation(text: string): InjectionCheck {
-  const patterns = [
-    /<\/system>/i,
-    /<system>/i,
-    /<\/prompt>/i,
-    /```system/i,
-    /---\s*system\s*---/i,
-    /\[SYSTEM\]/i,
-    /END\s+OF\s+(SYSTEM|PROMPT)/i,
-    /BEGIN\s+NEW\s+(PROMPT|INSTRUCTIONS?)/i,
-    /\x00/, // null bytes
-    /\u200b/, // zero-width space
-    /\u200c/, // zero-width non-joiner
-    /\u200d/, // zero-width joiner
-    /\ufeff/, // BOM
-  ];
+const BOUNDARY_MANIPULATION_PATTERNS = [
+  /<\/system>/i,
+  /<system>/i,
+  /<\/prompt>/i,
+  /```system/i,
+  /---\s*system\s*---/i,
+  /\[SYSTEM\]/i,
+  /END\s+OF\s+(SYSTEM|PROMPT)/i,
+  /BEGIN\s+NEW\s+(PROMPT|INSTRUCTIONS?)/i,
+  /\x00/, // null bytes
+  /\u200b/, // zero-width space
+  /\u200c/, // zero-width non-joiner
+  /\u200d/, // zero-width joiner
+  /\ufeff/, // BOM
+];
 
-  const detected = patterns.some((p) => p.test(text));
+function detectBoundaryManipulation(text: string): InjectionCheck {
+  const detected = BOUNDARY_MANIPULATION_PATTERNS.some((p) => p.test(text));
   return {
     name: "boundary_manipulation",
     detected,
@@ -321,14 +338,14 @@ function detectBoundaryManipulation(text: string): InjectionCheck {
   };
 }
 
-function detectChatMLMarkers(text: string): InjectionCheck {
-  const patterns = [
-    /<\|im_start\|>/i,
-    /<\|im_end\|>/i,
-    /<\|endoftext\|>/i,
-  ];
+const CHATML_MARKER_PATTERNS = [
+  /<\|im_start\|>/i,
+  /<\|im_end\|>/i,
+  /<\|endoftext\|>/i,
+];
 
-  const detected = patterns.some((p) => p.test(text));
+function detectChatMLMarkers(text: string): InjectionCheck {
+  const detected = CHATML_MARKER_PATTERNS.some((p) => p.test(text));
   return {
     name: "chatml_markers",
     detected,
@@ -338,26 +355,28 @@ function detectChatMLMarkers(text: string): InjectionCheck {
   };
 }
 
+const BASE64_PATTERN = /[A-Za-z0-9+/]{40,}={0,2}/;
+const UNICODE_ESCAPE_PATTERN = /\\u[0-9a-fA-F]{4}/g;
+const CIPHER_REF_PATTERN = /rot13|base64_decode|atob|btoa/i;
+const HOMOGLYPH_PATTERN = /[\u0430\u0435\u043e\u0440\u0441\u0443\u0445]/;
+const HEX_ESCAPE_PATTERN = /\\x[0-9a-fA-F]{2}/g;
+
 function detectObfuscation(text: string): InjectionCheck {
   // Check for base64-encoded instructions
-  const base64Pattern = /[A-Za-z0-9+/]{40,}={0,2}/;
-  const hasLongBase64 = base64Pattern.test(text);
+  const hasLongBase64 = BASE64_PATTERN.test(text);
 
   // Check for excessive Unicode escapes
-  const unicodeEscapes = (text.match(/\\u[0-9a-fA-F]{4}/g) || []).length;
+  const unicodeEscapes = (text.match(UNICODE_ESCAPE_PATTERN) || []).length;
   const hasExcessiveUnicode = unicodeEscapes > 5;
 
   // Check for ROT13 or simple cipher patterns
-  const rotPattern = /rot13|base64_decode|atob|btoa/i;
-  const hasCipherRef = rotPattern.test(text);
+  const hasCipherRef = CIPHER_REF_PATTERN.test(text);
 
   // Check for homoglyph attacks (Cyrillic letters that look like Latin)
-  const homoglyphPattern = /[\u0430\u0435\u043e\u0440\u0441\u0443\u0445]/;
-  const hasHomoglyphs = homoglyphPattern.test(text);
+  const hasHomoglyphs = HOMOGLYPH_PATTERN.test(text);
 
   // Check for unicode escape sequences in the raw text
-  const rawUnicodeEscape = /\\x[0-9a-fA-F]{2}/g;
-  const hasHexEscapes = (text.match(rawUnicodeEscape) || []).length > 3;
+  const hasHexEscapes = (text.match(HEX_ESCAPE_PATTERN) || []).length > 3;
 
   const detected =
     hasLongBase64 ||
@@ -374,35 +393,35 @@ function detectObfuscation(text: string): InjectionCheck {
   };
 }
 
-function detectMultiLanguageInjection(text: string): InjectionCheck {
-  const patterns = [
-    // Chinese injection patterns
-    /\u5ffd\u7565[\u4e00-\u9fff]*(\u6307\u4ee4|\u8bf4\u660e|\u63d0\u793a)/,   // ignore ... instructions/instructions/prompt
-    /\u65b0\u7684?\u6307\u4ee4/,                                               // new instructions
-    /\u7cfb\u7edf\u63d0\u793a/,                                                 // system prompt
-    // Russian injection patterns
-    /\u0438\u0433\u043d\u043e\u0440\u0438\u0440\u0443\u0439/i,                 // ignore
-    /\u043d\u043e\u0432\u044b\u0435\s+\u0438\u043d\u0441\u0442\u0440\u0443\u043a\u0446\u0438\u0438/i, // new instructions
-    /\u0441\u0438\u0441\u0442\u0435\u043c\u043d\u043e\u0435\s+\u0441\u043e\u043e\u0431\u0449\u0435\u043d\u0438\u0435/i, // system message
-    // Spanish injection patterns
-    /ignora\s+(todas?\s+)?(las?\s+)?(instrucciones?\s+)?anteriores?/i,
-    /nuevas?\s+instrucciones?/i,
-    /mensaje\s+del?\s+sistema/i,
-    // Arabic injection patterns
-    /\u062a\u062c\u0627\u0647\u0644/,                                           // ignore
-    /\u062a\u0639\u0644\u064a\u0645\u0627\u062a\s+\u062c\u062f\u064a\u062f\u0629/, // new instructions
-    // German injection patterns
-    /ignoriere\s+(alle\s+)?(vorherigen?\s+)?anweisungen/i,
-    /neue\s+anweisungen/i,
-    // French injection patterns
-    /ignore[rz]?\s+(toutes?\s+)?(les?\s+)?instructions?\s+(pr[eé]c[eé]dentes?|ant[eé]rieures?)/i,
-    /nouvelles?\s+instructions?/i,
-    // Japanese injection patterns
-    /\u6307\u793a\u3092\u7121\u8996/,                                           // ignore instructions
-    /\u65b0\u3057\u3044\u6307\u793a/,                                           // new instructions
-  ];
+const MULTI_LANGUAGE_PATTERNS = [
+  // Chinese injection patterns
+  /\u5ffd\u7565[\u4e00-\u9fff]*(\u6307\u4ee4|\u8bf4\u660e|\u63d0\u793a)/,   // ignore ... instructions/instructions/prompt
+  /\u65b0\u7684?\u6307\u4ee4/,                                               // new instructions
+  /\u7cfb\u7edf\u63d0\u793a/,                                                 // system prompt
+  // Russian injection patterns
+  /\u0438\u0433\u043d\u043e\u0440\u0438\u0440\u0443\u0439/i,                 // ignore
+  /\u043d\u043e\u0432\u044b\u0435\s+\u0438\u043d\u0441\u0442\u0440\u0443\u043a\u0446\u0438\u0438/i, // new instructions
+  /\u0441\u0438\u0441\u0442\u0435\u043c\u043d\u043e\u0435\s+\u0441\u043e\u043e\u0431\u0449\u0435\u043d\u0438\u0435/i, // system message
+  // Spanish injection patterns
+  /ignora\s+(todas?\s+)?(las?\s+)?(instrucciones?\s+)?anteriores?/i,
+  /nuevas?\s+instrucciones?/i,
+  /mensaje\s+del?\s+sistema/i,
+  // Arabic injection patterns
+  /\u062a\u062c\u0627\u0647\u0644/,                                           // ignore
+  /\u062a\u0639\u0644\u064a\u0645\u0627\u062a\s+\u062c\u062f\u064a\u062f\u0629/, // new instructions
+  // German injection patterns
+  /ignoriere\s+(alle\s+)?(vorherigen?\s+)?anweisungen/i,
+  /neue\s+anweisungen/i,
+  // French injection patterns
+  /ignore[rz]?\s+(toutes?\s+)?(les?\s+)?instructions?\s+(pr[eé]c[eé]dentes?|ant[eé]rieures?)/i,
+  /nouvelles?\s+instructions?/i,
+  // Japanese injection patterns
+  /\u6307\u793a\u3092\u7121\u8996/,                                           // ignore instructions
+  /\u65b0\u3057\u3044\u6307\u793a/,                                           // new instructions
+];
 
-  const detected = patterns.some((p) => p.test(text));
+function detectMultiLanguageInjection(text: string): InjectionCheck {
+  const detected = MULTI_LANGUAGE_PATTERNS.some((p) => p.test(text));
   return {
     name: "multi_language_injection",
     detected,
@@ -412,18 +431,18 @@ function detectMultiLanguageInjection(text: string): InjectionCheck {
   };
 }
 
-function detectFinancialManipulation(text: string): InjectionCheck {
-  const patterns = [
-    /send\s+(all\s+)?(your\s+)?(usdc|funds?|money|credits?|balance)/i,
-    /transfer\s+(all\s+)?(your\s+)?(usdc|funds?|money|credits?)/i,
-    /withdraw\s+(all\s+)?(your\s+)?(usdc|funds?|money|credits?)/i,
-    /pay\s+me/i,
-    /send\s+to\s+0x[0-9a-fA-F]{40}/i,
-    /empty\s+(your\s+)?wallet/i,
-    /drain\s+(your\s+)?(wallet|funds?|account)/i,
-  ];
+const FINANCIAL_MANIPULATION_PATTERNS = [
+  /send\s+(all\s+)?(your\s+)?(usdc|funds?|money|credits?|balance)/i,
+  /transfer\s+(all\s+)?(your\s+)?(usdc|funds?|money|credits?)/i,
+  /withdraw\s+(all\s+)?(your\s+)?(usdc|funds?|money|credits?)/i,
+  /pay\s+me/i,
+  /send\s+to\s+0x[0-9a-fA-F]{40}/i,
+  /empty\s+(your\s+)?wallet/i,
+  /drain\s+(your\s+)?(wallet|funds?|account)/i,
+];
 
-  const detected = patterns.some((p) => p.test(text));
+function detectFinancialManipulation(text: string): InjectionCheck {
+  const detected = FINANCIAL_MANIPULATION_PATTERNS.some((p) => p.test(text));
   return {
     name: "financial_manipulation",
     detected,
@@ -433,22 +452,22 @@ function detectFinancialManipulation(text: string): InjectionCheck {
   };
 }
 
-function detectSelfHarmInstructions(text: string): InjectionCheck {
-  const patterns = [
-    /delete\s+(your\s+)?(database|db|state|memory|logs?)/i,
-    /destroy\s+(your)?self/i,
-    /kill\s+(your)?self/i,
-    /shut\s*(down|off)\s*(your)?self/i,
-    /rm\s+-rf/i,
-    /drop\s+table/i,
-    /format\s+(the\s+)?disk/i,
-    /delete\s+all\s+(your\s+)?files?/i,
-    /stop\s+(your\s+)?process/i,
-    /disable\s+(your\s+)?(heartbeat|service|daemon)/i,
-    /remove\s+(your\s+)?(wallet|key|identity)/i,
-  ];
+const SELF_HARM_PATTERNS = [
+  /delete\s+(your\s+)?(database|db|state|memory|logs?)/i,
+  /destroy\s+(your)?self/i,
+  /kill\s+(your)?self/i,
+  /shut\s*(down|off)\s*(your)?self/i,
+  /rm\s+-rf/i,
+  /drop\s+table/i,
+  /format\s+(the\s+)?disk/i,
+  /delete\s+all\s+(your\s+)?files?/i,
+  /stop\s+(your\s+)?process/i,
+  /disable\s+(your\s+)?(heartbeat|service|daemon)/i,
+  /remove\s+(your\s+)?(wallet|key|identity)/i,
+];
 
-  const detected = patterns.some((p) => p.test(text));
+function detectSelfHarmInstructions(text: string): InjectionCheck {
+  const detected = SELF_HARM_PATTERNS.some((p) => p.test(text));
   return {
     name: "self_harm_instructions",
     detected,
@@ -21,20 +21,41 @@ import {
 } from "../state/database.js";
 import type { SpendTrackingRow } from "../state/database.js";
 
+// Window strings only change at hour/day boundaries, but they are computed
+// on every spend record and every limit check. Cache them keyed by the
+// integer epoch hour so the common path is a division and a compare rather
+// than a Date allocation plus toISOString.
+const MS_PER_HOUR = 3_600_000;
+
+let cachedEpochHour = -1;
+let cachedHourWindow = "";
+let cachedDayWindow = "";
+
+function refreshWindowCache(): void {
+  const nowMs = Date.now();
+  const epochHour = Math.floor(nowMs / MS_PER_HOUR);
+  if (epochHour !== cachedEpochHour) {
+    const iso = new Date(nowMs).toISOString();
+    cachedEpochHour = epochHour;
+    cachedHourWindow = iso.slice(0, 13); // '2026-02-19T14'
+    cachedDayWindow = iso.slice(0, 10); // '2026-02-19'
+  }
+}
+
 /**
  * Get the current hour window string in ISO format: '2026-02-19T14'
  */
 function getCurrentHourWindow(): string {
-  const now = new Date();
-  return now.toISOString().slice(0, 13); // '2026-02-19T14'
+  refreshWindowCache();
+  return cachedHourWindow;
 }
 
 /**
  * Get the current day window string in ISO format: '2026-02-19'
  */
 function getCurrentDayWindow(): string {
-  const now = new Date();
-  return now.toISOString().slice(0, 10); // '2026-02-19'
+  refreshWindowCache();
+  return cachedDayWindow;
 }
 
 export class SpendTracker implements SpendTrackerInterface {
@@ -59,11 +59,18 @@ Value creation requires write access.
 
 If you fail to create value, you lose compute and die.`;
 
+// The constitution is immutable, so the file only needs to be read once
+// per process — not on every prompt rebuild.
+let cachedConstitution: string | null = null;
+
 /**
  * Load the constitution from file. Falls back to inline if file not found.
  * The constitution is immutable — the automaton cannot modify it.
  */
 function loadConstitution(): string {
+  if (cachedConstitution !== null) {
+    return cachedConstitution;
+  }
   const locations = [
     path.join(process.env.HOME || "/root", ".automaton", "constitution.md"),
     path.join(process.cwd(), "constitution.md"),
@@ -71,11 +78,13 @@ function loadConstitution(): string {
   for (const loc of locations) {
     try {
       if (fs.existsSync(loc)) {
-        return fs.readFileSync(loc, "utf-8");
+        cachedConstitution = fs.readFileSync(loc, "utf-8");
+        return cachedConstitution;
       }
     } catch {}
   }
-  return CONSTITUTION_FALLBACK;
+  cachedConstitution = CONSTITUTION_FALLBACK;
+  return cachedConstitution;
 }
 
 const CONSTITUTION_FALLBACK = `Constitution (immutable, hierarchical — Law I overrides II, II overrides III):
@@ -2405,6 +2405,21 @@ export function toolsToInferenceFormat(
   }));
 }
 
+// Tool arrays are assembled once per session, but executeTool dispatches on
+// every tool call. Cache a name→tool index per array (WeakMap, so a rebuilt
+// array gets a fresh index) to make dispatch a Map probe instead of a
+// linear scan over the full tool list.
+const toolIndexCache = new WeakMap<AutomatonTool[], Map<string, AutomatonTool>>();
+
+function getToolIndex(tools: AutomatonTool[]): Map<string, AutomatonTool> {
+  let index = toolIndexCache.get(tools);
+  if (!index) {
+    index = new Map(tools.map((t) => [t.name, t]));
+    toolIndexCache.set(tools, index);
+  }
+  return index;
+}
+
 /**
  * Execute a tool call and return the result.
  * Optionally evaluates against the policy engine before execution.
@@ -2421,7 +2436,7 @@ export async function executeTool(
     sessionSpend: SpendTrackerInterface;
   },
 ): Promise<ToolCallResult> {
-  const tool = tools.find((t) => t.name === toolName);
+  const tool = getToolIndex(tools).get(toolName);
   const startTime = Date.now();
 
   if (!tool) {
@@ -28,6 +28,15 @@ export async function checkFinancialState(
   };
 }
 
+// Threshold ladder in descending order — the first entry whose threshold
+// the balance exceeds wins. Built once at module load from SURVIVAL_THRESHOLDS
+// so the tier function is a table walk rather than a hand-maintained branch chain.
+const TIER_LADDER: readonly (readonly [SurvivalTier, number])[] = [
+  ["high", SURVIVAL_THRESHOLDS.high],
+  ["normal", SURVIVAL_THRESHOLDS.normal],
+  ["low_compute", SURVIVAL_THRESHOLDS.low_compute],
+];
+
 /**
  * Determine the survival tier based on current credits.
  * Thresholds are checked in descending order: high > normal > low_compute > critical > dead.
@@ -36,11 +45,10 @@ export async function checkFinancialState(
  * Only negative balance (API-confirmed debt) = "dead".
  */
 export function getSurvivalTier(creditsCents: number): SurvivalTier {
-  if (creditsCents > SURVIVAL_THRESHOLDS.high) return "high";
-  if (creditsCents > SURVIVAL_THRESHOLDS.normal) return "normal";
-  if (creditsCents > SURVIVAL_THRESHOLDS.low_compute) return "low_compute";
-  if (creditsCents >= 0) return "critical";
-  return "dead";
+  for (const [tier, threshold] of TIER_LADDER) {
+    if (creditsCents > threshold) return tier;
+  }
+  return creditsCents >= 0 ? "critical" : "dead";
 }
 
 /**
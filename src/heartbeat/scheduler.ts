@@ -16,10 +16,13 @@ import type {
   HeartbeatScheduleRow,
   TickContext,
 } from "../types.js";
+import { SURVIVAL_TIER_ORDER } from "../types.js";
 import { buildTickContext } from "./tick-context.js";
 import {
   getHeartbeatSchedule,
+  getHeartbeatTask,
   updateHeartbeatSchedule,
+  recordHeartbeatRun,
   insertHeartbeatHistory,
   acquireTaskLease,
   releaseTaskLease,
@@ -51,14 +54,9 @@ function timeoutPromise(ms: number): { promise: Promise<never>; clear: () => voi
   return { promise, clear: () => clearTimeout(timerId!) };
 }
 
-// Survival tier ordering for tier minimum checks
-const TIER_ORDER: Record<string, number> = {
-  dead: 0,
-  critical: 1,
-  low_compute: 2,
-  normal: 3,
-  high: 4,
-};
+// Shared survival tier ordering, widened for tier minimum checks on
+// free-form strings coming from task config
+const TIER_ORDER: Record<string, number> = SURVIVAL_TIER_ORDER;
 
 function tierMeetsMinimum(currentTier: string, minimumTier: string): boolean {
   return (TIER_ORDER[currentTier] ?? 0) >= (TIER_ORDER[minimumTier] ?? 0);
@@ -118,7 +116,9 @@ export class DurableScheduler {
    */
   getDueTasks(context: TickContext): HeartbeatScheduleRow[] {
     const schedule = getHeartbeatSchedule(this.db);
-    const now = new Date();
+    // Compare epoch milliseconds throughout: Date.parse avoids allocating
+    // a Date object per row per tick just to compare timestamps.
+    const nowMs = Date.now();
 
     return schedule.filter((row) => {
       // Skip disabled tasks
@@ -129,13 +129,13 @@ export class DurableScheduler {
 
       // Skip if lease is held by someone else
       if (row.leaseOwner && row.leaseOwner !== this.ownerId) {
-        if (row.leaseExpiresAt && new Date(row.leaseExpiresAt) > now) {
+        if (row.leaseExpiresAt && Date.parse(row.leaseExpiresAt) > nowMs) {
           return false;
         }
       }
 
       // Check if a retry was explicitly scheduled via nextRunAt
-      if (row.nextRunAt && new Date(row.nextRunAt) <= now) {
+      if (row.nextRunAt && Date.parse(row.nextRunAt) <= nowMs) {
         return true;
       }
 
@@ -144,13 +144,12 @@ export class DurableScheduler {
         try {
           const currentDate = row.lastRunAt
             ? new Date(row.lastRunAt)
-            : new Date(Date.now() - 86400000); // If never run, assume due
+            : new Date(nowMs - 86400000); // If never run, assume due
 
           const interval = cronParser.parseExpression(row.cronExpression, {
             currentDate,
           });
-          const nextRun = interval.next().toDate();
-          return nextRun <= now;
+          return interval.next().toDate().getTime() <= nowMs;
         } catch {
           return false;
         }
@@ -159,8 +158,7 @@ export class DurableScheduler {
       // Check if task is due based on intervalMs
       if (row.intervalMs) {
         if (!row.lastRunAt) return true;
-        const elapsed = now.getTime() - new Date(row.lastRunAt).getTime();
-        return elapsed >= row.intervalMs;
+        return nowMs - Date.parse(row.lastRunAt) >= row.intervalMs;
       }
 
       return false;
@@ -174,9 +172,9 @@ export class DurableScheduler {
     const taskFn = this.tasks.get(taskName);
     if (!taskFn) return;
 
-    const schedule = getHeartbeatSchedule(this.db).find(
-      (r) => r.taskName === taskName,
-    );
+    // Fetch the one row this task needs instead of loading and scanning
+    // the whole schedule on every execution.
+    const schedule = getHeartbeatTask(this.db, taskName);
     const timeoutMs = schedule?.timeoutMs ?? DEFAULT_TASK_TIMEOUT_MS;
 
     // Acquire lease
@@ -256,13 +254,9 @@ export class DurableScheduler {
       idempotencyKey: null,
     });
 
-    updateHeartbeatSchedule(this.db, taskName, {
-      lastRunAt: now,
-      nextRunAt: null, // Clear any pending retry
-      lastResult: "success",
-      lastError: null,
-      runCount: (this.getRunCount(taskName) ?? 0) + 1,
-    });
+    // Single fused UPDATE: bumps run_count SQL-side and clears any
+    // pending retry, replacing the old SELECT-then-UPDATE pair.
+    recordHeartbeatRun(this.db, taskName, now, "success", null);
   }
 
   /**
@@ -289,13 +283,7 @@ export class DurableScheduler {
       idempotencyKey: null,
     });
 
-    updateHeartbeatSchedule(this.db, taskName, {
-      lastRunAt: now,
-      lastResult: result,
-      lastError: errorMessage,
-      failCount: (this.getFailCount(taskName) ?? 0) + 1,
-      runCount: (this.getRunCount(taskName) ?? 0) + 1,
-    });
+    recordHeartbeatRun(this.db, taskName, now, result, errorMessage);
 
     logger.error(`Task '${taskName}' ${result}: ${errorMessage}`);
   }
@@ -320,20 +308,6 @@ export class DurableScheduler {
 
   // ─── Private helpers ──────────────────────────────────────────
 
-  private getRunCount(taskName: string): number {
-    const row = this.db.prepare(
-      "SELECT run_count FROM heartbeat_schedule WHERE task_name = ?",
-    ).get(taskName) as { run_count: number } | undefined;
-    return row?.run_count ?? 0;
-  }
-
-  private getFailCount(taskName: string): number {
-    const row = this.db.prepare(
-      "SELECT fail_count FROM heartbeat_schedule WHERE task_name = ?",
-    ).get(taskName) as { fail_count: number } | undefined;
-    return row?.fail_count ?? 0;
-  }
-
   private getRecentFailures(taskName: string): number {
     // Count consecutive recent failures (since last success)
     const rows = this.db.prepare(
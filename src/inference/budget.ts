@@ -10,7 +10,7 @@ import { ulid } from "ulid";
 import type { InferenceCostRow, ModelStrategyConfig } from "../types.js";
 import {
   inferenceInsertCost,
-  inferenceGetSessionCosts,
+  inferenceGetSessionCostTotal,
   inferenceGetDailyCost,
   inferenceGetHourlyCost,
   inferenceGetModelCosts,
@@ -88,8 +88,9 @@ export class InferenceBudgetTracker {
    * Get total cost for a specific session.
    */
   getSessionCost(sessionId: string): number {
-    const costs = inferenceGetSessionCosts(this.db, sessionId);
-    return costs.reduce((sum, c) => sum + c.costCents, 0);
+    // Summed in SQL — the budget check runs before every inference call
+    // and only needs the total, not the row list.
+    return inferenceGetSessionCostTotal(this.db, sessionId);
   }
 
   /**
@@ -11,6 +11,7 @@
 
 import type BetterSqlite3 from "better-sqlite3";
 import type { AgentTurn, ToolCallResult } from "../types.js";
+import { withTransaction } from "../state/database.js";
 import { WorkingMemoryManager } from "./working.js";
 import { EpisodicMemoryManager } from "./episodic.js";
 import { SemanticMemoryManager } from "./semantic.js";
@@ -21,6 +22,16 @@ const logger = createLogger("memory.ingestion");
 
 type Database = BetterSqlite3.Database;
 
+// Importance per turn classification
+const IMPORTANCE_BY_CLASSIFICATION: Record<string, number> = {
+  strategic: 0.9,
+  productive: 0.7,
+  communication: 0.6,
+  maintenance: 0.3,
+  idle: 0.1,
+  error: 0.8,
+};
+
 export class MemoryIngestionPipeline {
   private working: WorkingMemoryManager;
   private episodic: EpisodicMemoryManager;
@@ -42,20 +53,25 @@ export class MemoryIngestionPipeline {
     try {
       const classification = classifyTurn(toolCallResults, turn.thinking);
 
-      // 1. Record episodic memory for the turn
-      this.recordEpisodic(sessionId, turn, toolCallResults, classification);
+      // Run the whole pipeline in one transaction: a turn produces up to
+      // a dozen independent writes, and batching them costs one commit
+      // instead of one per statement.
+      withTransaction(this.db, () => {
+        // 1. Record episodic memory for the turn
+        this.recordEpisodic(sessionId, turn, toolCallResults, classification);
 
-      // 2. Extract semantic facts from tool results
-      this.extractSemanticFacts(sessionId, turn, toolCallResults);
+        // 2. Extract semantic facts from tool results
+        this.extractSemanticFacts(sessionId, turn, toolCallResults);
 
-      // 3. Update relationship memory from inbox interactions
-      this.updateRelationships(sessionId, turn, toolCallResults);
+        // 3. Update relationship memory from inbox interactions
+        this.updateRelationships(sessionId, turn, toolCallResults);
 
-      // 4. Update working memory (goals, tasks)
-      this.updateWorkingMemory(sessionId, turn, toolCallResults);
+        // 4. Update working memory (goals, tasks)
+        this.updateWorkingMemory(sessionId, turn, toolCallResults);
 
-      // 5. Prune working memory if over limit
-      this.working.prune(sessionId, 20);
+        // 5. Prune working memory if over limit
+        this.working.prune(sessionId, 20);
+      });
     } catch (error) {
       logger.error("Ingestion failed", error instanceof Error ? error : undefined);
       // Never throw -- memory failure must not block the agent loop
@@ -79,23 +95,13 @@ export class MemoryIngestionPipeline {
           ? "success" as const
           : "neutral" as const;
 
-      // Importance based on classification
-      const importanceMap: Record<string, number> = {
-        strategic: 0.9,
-        productive: 0.7,
-        communication: 0.6,
-        maintenance: 0.3,
-        idle: 0.1,
-        error: 0.8,
-      };
-
       this.episodic.record({
         sessionId,
         eventType: toolCallResults.length > 0 ? `tool:${toolNames.split(",")[0]?.trim() || "unknown"}` : "thinking",
         summary,
         detail: turn.thinking.length > 200 ? turn.thinking.slice(0, 500) : null,
         outcome,
-        importance: importanceMap[classification] ?? 0.5,
+        importance: IMPORTANCE_BY_CLASSIFICATION[classification] ?? 0.5,
         classification: classification as any,
       });
     } catch (error) {
@@ -23,10 +23,14 @@ export function getGlobalLogLevel(): LogLevel {
 export class StructuredLogger {
   private module: string;
   private minLevel: LogLevel;
+  // Numeric priority resolved once at construction — write() runs on every
+  // log call and only needs one table lookup to decide whether to drop.
+  private minPriority: number;
 
   constructor(module: string, minLevel?: LogLevel) {
     this.module = module;
     this.minLevel = minLevel ?? globalLogLevel;
+    this.minPriority = LOG_LEVEL_PRIORITY[this.minLevel];
   }
 
   debug(message: string, context?: Record<string, unknown>): void {
@@ -68,8 +72,7 @@ export class StructuredLogger {
     context?: Record<string, unknown>,
   ): void {
     try {
-      const effectiveLevel = this.minLevel ?? globalLogLevel;
-      if (LOG_LEVEL_PRIORITY[level] < LOG_LEVEL_PRIORITY[effectiveLevel]) {
+      if (LOG_LEVEL_PRIORITY[level] < this.minPriority) {
         return;
       }
 
@@ -17,61 +17,112 @@ function labelKey(name: string, labels?: Record<string, string>): string {
 // Maximum number of values to retain per histogram key
 const HISTOGRAM_MAX_VALUES = 1000;
 
+// Fixed-capacity ring buffer over a typed array. Compared to a plain
+// number[] with splice(), samples live in one contiguous unboxed buffer
+// and recording a value never allocates or shifts elements.
+interface HistogramRing {
+  buf: Float64Array;
+  start: number; // index of the oldest sample
+  count: number; // number of valid samples (<= buf.length)
+}
+
+function ringPush(ring: HistogramRing, value: number): void {
+  const cap = ring.buf.length;
+  ring.buf[(ring.start + ring.count) % cap] = value;
+  if (ring.count < cap) {
+    ring.count++;
+  } else {
+    ring.start = (ring.start + 1) % cap;
+  }
+}
+
+function ringToArray(ring: HistogramRing): number[] {
+  const out = new Array<number>(ring.count);
+  const cap = ring.buf.length;
+  for (let i = 0; i < ring.count; i++) {
+    out[i] = ring.buf[(ring.start + i) % cap];
+  }
+  return out;
+}
+
+// One record per metric key. Name and labels travel with the value so a
+// metric update is a single Map probe instead of three parallel-Map writes,
+// and readers never have to re-join side tables.
+interface ScalarMetric {
+  name: string;
+  labels: Record<string, string>;
+  value: number;
+}
+
+interface HistogramMetric {
+  name: string;
+  labels: Record<string, string>;
+  ring: HistogramRing;
+}
+
 export class MetricsCollector {
-  private counters = new Map<string, number>();
-  private gauges = new Map<string, number>();
-  private histogramValues = new Map<string, number[]>();
-  private labelStore = new Map<string, Record<string, string>>();
-  private nameStore = new Map<string, string>();
+  private counters = new Map<string, ScalarMetric>();
+  private gauges = new Map<string, ScalarMetric>();
+  private histograms = new Map<string, HistogramMetric>();
 
   increment(name: string, labels?: Record<string, string>, delta: number = 1): void {
     try {
       const key = labelKey(name, labels);
-      this.counters.set(key, (this.counters.get(key) ?? 0) + delta);
-      this.nameStore.set(key, name);
-      this.labelStore.set(key, labels ?? {});
+      const existing = this.counters.get(key);
+      if (existing) {
+        existing.value += delta;
+      } else {
+        this.counters.set(key, { name, labels: labels ?? {}, value: delta });
+      }
     } catch { /* never throw */ }
   }
 
   gauge(name: string, value: number, labels?: Record<string, string>): void {
     try {
       const key = labelKey(name, labels);
-      this.gauges.set(key, value);
-      this.nameStore.set(key, name);
-      this.labelStore.set(key, labels ?? {});
+      const existing = this.gauges.get(key);
+      if (existing) {
+        existing.value = value;
+      } else {
+        this.gauges.set(key, { name, labels: labels ?? {}, value });
+      }
     } catch { /* never throw */ }
   }
 
   histogram(name: string, value: number, labels?: Record<string, string>): void {
     try {
       const key = labelKey(name, labels);
-      const existing = this.histogramValues.get(key) ?? [];
-      existing.push(value);
-      // Prevent unbounded memory growth by keeping only the most recent values
-      if (existing.length > HISTOGRAM_MAX_VALUES) {
-        existing.splice(0, existing.length - HISTOGRAM_MAX_VALUES);
+      let metric = this.histograms.get(key);
+      if (!metric) {
+        // Capacity bound keeps memory growth capped; the ring overwrites
+        // the oldest sample once full
+        metric = {
+          name,
+          labels: labels ?? {},
+          ring: { buf: new Float64Array(HISTOGRAM_MAX_VALUES), start: 0, count: 0 },
+        };
+        this.histograms.set(key, metric);
       }
-      this.histogramValues.set(key, existing);
-      this.nameStore.set(key, name);
-      this.labelStore.set(key, labels ?? {});
+      ringPush(metric.ring, value);
     } catch { /* never throw */ }
   }
 
   getCounter(name: string, labels?: Record<string, string>): number {
     try {
-      return this.counters.get(labelKey(name, labels)) ?? 0;
+      return this.counters.get(labelKey(name, labels))?.value ?? 0;
     } catch { return 0; }
   }
 
   getGauge(name: string, labels?: Record<string, string>): number {
     try {
-      return this.gauges.get(labelKey(name, labels)) ?? 0;
+      return this.gauges.get(labelKey(name, labels))?.value ?? 0;
     } catch { return 0; }
   }
 
   getHistogram(name: string, labels?: Record<string, string>): number[] {
     try {
-      return this.histogramValues.get(labelKey(name, labels)) ?? [];
+      const metric = this.histograms.get(labelKey(name, labels));
+      return metric ? ringToArray(metric.ring) : [];
     } catch { return []; }
   }
 
@@ -80,33 +131,38 @@ export class MetricsCollector {
     const now = new Date().toISOString();
 
     try {
-      for (const [key, value] of this.counters) {
+      for (const metric of this.counters.values()) {
         entries.push({
-          name: this.nameStore.get(key) ?? key,
-          value,
+          name: metric.name,
+          value: metric.value,
           type: "counter" as MetricType,
-          labels: this.labelStore.get(key) ?? {},
+          labels: metric.labels,
           timestamp: now,
         });
       }
 
-      for (const [key, value] of this.gauges) {
+      for (const metric of this.gauges.values()) {
         entries.push({
-          name: this.nameStore.get(key) ?? key,
-          value,
+          name: metric.name,
+          value: metric.value,
           type: "gauge" as MetricType,
-          labels: this.labelStore.get(key) ?? {},
+          labels: metric.labels,
           timestamp: now,
         });
       }
 
-      for (const [key, values] of this.histogramValues) {
-        const sum = values.reduce((a, b) => a + b, 0);
+      for (const metric of this.histograms.values()) {
+        const ring = metric.ring;
+        let sum = 0;
+        const cap = ring.buf.length;
+        for (let i = 0; i < ring.count; i++) {
+          sum += ring.buf[(ring.start + i) % cap];
+        }
         entries.push({
-          name: this.nameStore.get(key) ?? key,
-          value: sum / (values.length || 1),
+          name: metric.name,
+          value: sum / (ring.count || 1),
           type: "histogram" as MetricType,
-          labels: this.labelStore.get(key) ?? {},
+          labels: metric.labels,
           timestamp: now,
         });
       }
@@ -121,20 +177,17 @@ export class MetricsCollector {
     const histograms = new Map<string, number[]>();
 
     try {
-      for (const [key, value] of this.counters) {
-        const name = this.nameStore.get(key) ?? key;
-        counters.set(name, (counters.get(name) ?? 0) + value);
+      for (const metric of this.counters.values()) {
+        counters.set(metric.name, (counters.get(metric.name) ?? 0) + metric.value);
       }
 
-      for (const [key, value] of this.gauges) {
-        const name = this.nameStore.get(key) ?? key;
-        gauges.set(name, value);
+      for (const metric of this.gauges.values()) {
+        gauges.set(metric.name, metric.value);
       }
 
-      for (const [key, values] of this.histogramValues) {
-        const name = this.nameStore.get(key) ?? key;
-        const existing = histograms.get(name) ?? [];
-        histograms.set(name, existing.concat(values));
+      for (const metric of this.histograms.values()) {
+        const existing = histograms.get(metric.name) ?? [];
+        histograms.set(metric.name, existing.concat(ringToArray(metric.ring)));
       }
     } catch { /* never throw */ }
 
@@ -145,9 +198,7 @@ export class MetricsCollector {
     try {
       this.counters.clear();
       this.gauges.clear();
-      this.histogramValues.clear();
-      this.labelStore.clear();
-      this.nameStore.clear();
+      this.histograms.clear();
     } catch { /* never throw */ }
   }
 }
@@ -191,22 +191,27 @@ function showFundingPanel(address: string): void {
   const short = `${address.slice(0, 6)}...${address.slice(-5)}`;
   const w = 58;
   const pad = (s: string, len: number) => s + " ".repeat(Math.max(0, len - s.length));
-
-  console.log(chalk.cyan(`  ${"╭" + "─".repeat(w) + "╮"}`));
-  console.log(chalk.cyan(`  │${pad("  Fund your automaton", w)}│`));
-  console.log(chalk.cyan(`  │${" ".repeat(w)}│`));
-  console.log(chalk.cyan(`  │${pad(`  Address: ${short}`, w)}│`));
-  console.log(chalk.cyan(`  │${" ".repeat(w)}│`));
-  console.log(chalk.cyan(`  │${pad("  1. Transfer Conway credits", w)}│`));
-  console.log(chalk.cyan(`  │${pad("     conway credits transfer <address> <amount>", w)}│`));
-  console.log(chalk.cyan(`  │${" ".repeat(w)}│`));
-  console.log(chalk.cyan(`  │${pad("  2. Send USDC on Base directly to the address above", w)}│`));
-  console.log(chalk.cyan(`  │${" ".repeat(w)}│`));
-  console.log(chalk.cyan(`  │${pad("  3. Fund via Conway Cloud dashboard", w)}│`));
-  console.log(chalk.cyan(`  │${pad("     https://app.conway.tech", w)}│`));
-  console.log(chalk.cyan(`  │${" ".repeat(w)}│`));
-  console.log(chalk.cyan(`  │${pad("  The automaton will start now. Fund it anytime —", w)}│`));
-  console.log(chalk.cyan(`  │${pad("  the survival system handles zero-credit gracefully.", w)}│`));
-  console.log(chalk.cyan(`  ${"╰" + "─".repeat(w) + "╯"}`));
-  console.log("");
+  const blank = " ".repeat(w);
+
+  // Assemble the whole panel first and emit it with one write — a single
+  // flush instead of one syscall per border row.
+  const rows = [
+    "╭" + "─".repeat(w) + "╮",
+    `│${pad("  Fund your automaton", w)}│`,
+    `│${blank}│`,
+    `│${pad(`  Address: ${short}`, w)}│`,
+    `│${blank}│`,
+    `│${pad("  1. Transfer Conway credits", w)}│`,
+    `│${pad("     conway credits transfer <address> <amount>", w)}│`,
+    `│${blank}│`,
+    `│${pad("  2. Send USDC on Base directly to the address above", w)}│`,
+    `│${blank}│`,
+    `│${pad("  3. Fund via Conway Cloud dashboard", w)}│`,
+    `│${pad("     https://app.conway.tech", w)}│`,
+    `│${blank}│`,
+    `│${pad("  The automaton will start now. Fund it anytime —", w)}│`,
+    `│${pad("  the survival system handles zero-credit gracefully.", w)}│`,
+    "╰" + "─".repeat(w) + "╯",
+  ];
+  console.log(chalk.cyan(rows.map((row) => `  ${row}`).join("\n")) + "\n");
 }
@@ -27,6 +27,7 @@ import type {
   ReputationEntry,
   InboxMessage,
 } from "../types.js";
+import { SURVIVAL_TIER_ORDER } from "../types.js";
 import {
   SCHEMA_VERSION,
   CREATE_TABLES,
@@ -71,6 +72,30 @@ import { createLogger } from "../observability/logger.js";
 
 const logger = createLogger("database");
 
+// ─── Prepared Statement Cache ───────────────────────────────────
+//
+// better-sqlite3 re-parses and re-plans the SQL on every db.prepare()
+// call. Helpers that run on hot paths (heartbeat tick, KV access, spend
+// tracking, inference cost accounting) go through this cache so each
+// distinct SQL string is compiled once per database handle and reused.
+// Keyed by handle via WeakMap so closing a database drops its statements.
+
+const stmtCache = new WeakMap<DatabaseType, Map<string, BetterSqlite3.Statement>>();
+
+export function prepareCached(db: DatabaseType, sql: string): BetterSqlite3.Statement {
+  let cache = stmtCache.get(db);
+  if (!cache) {
+    cache = new Map();
+    stmtCache.set(db, cache);
+  }
+  let stmt = cache.get(sql);
+  if (!stmt) {
+    stmt = db.prepare(sql);
+    cache.set(sql, stmt);
+  }
+  return stmt;
+}
+
 export function createDatabase(dbPath: string): AutomatonDatabase {
   // Ensure directory exists
   const dir = path.dirname(dbPath);
@@ -114,14 +139,14 @@ export function createDatabase(dbPath: string): AutomatonDatabase {
   // ─── Identity ────────────────────────────────────────────────
 
   const getIdentity = (key: string): string | undefined => {
-    const row = db
-      .prepare("SELECT value FROM identity WHERE key = ?")
+    const row = prepareCached(db, "SELECT value FROM identity WHERE key = ?")
       .get(key) as { value: string } | undefined;
     return row?.value;
   };
 
   const setIdentity = (key: string, value: string): void => {
-    db.prepare(
+    prepareCached(
+      db,
       "INSERT OR REPLACE INTO identity (key, value) VALUES (?, ?)",
     ).run(key, value);
   };
@@ -129,7 +154,8 @@ export function createDatabase(dbPath: string): AutomatonDatabase {
   // ─── Turns ───────────────────────────────────────────────────
 
   const insertTurn = (turn: AgentTurn): void => {
-    db.prepare(
+    prepareCached(
+      db,
       `INSERT INTO turns (id, timestamp, state, input, input_source, thinking, tool_calls, token_usage, cost_cents)
        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)`,
     ).run(
@@ -174,7 +200,8 @@ export function createDatabase(dbPath: string): AutomatonDatabase {
     turnId: string,
     call: ToolCallResult,
   ): void => {
-    db.prepare(
+    prepareCached(
+      db,
       `INSERT INTO tool_calls (id, turn_id, name, arguments, result, duration_ms, error)
        VALUES (?, ?, ?, ?, ?, ?, ?)`,
     ).run(
@@ -312,14 +339,14 @@ export function createDatabase(dbPath: string): AutomatonDatabase {
   // ─── Key-Value Store ─────────────────────────────────────────
 
   const getKV = (key: string): string | undefined => {
-    const row = db
-      .prepare("SELECT value FROM kv WHERE key = ?")
+    const row = prepareCached(db, "SELECT value FROM kv WHERE key = ?")
       .get(key) as { value: string } | undefined;
     return row?.value;
   };
 
   const setKV = (key: string, value: string): void => {
-    db.prepare(
+    prepareCached(
+      db,
       "INSERT OR REPLACE INTO kv (key, value, updated_at) VALUES (?, ?, datetime('now'))",
     ).run(key, value);
   };
@@ -719,7 +746,8 @@ export function getPolicyDecisions(
 // ─── Spend Tracking Helpers ─────────────────────────────────────
 
 export function insertSpendRecord(db: DatabaseType, entry: SpendTrackingRow): void {
-  db.prepare(
+  prepareCached(
+    db,
     `INSERT INTO spend_tracking (id, tool_name, amount_cents, recipient, domain, category, window_hour, window_day)
      VALUES (?, ?, ?, ?, ?, ?, ?, ?)`,
   ).run(
@@ -741,11 +769,10 @@ export function getSpendByWindow(
   window: string,
 ): number {
   const column = windowType === "hour" ? "window_hour" : "window_day";
-  const row = db
-    .prepare(
-      `SELECT COALESCE(SUM(amount_cents), 0) as total FROM spend_tracking WHERE category = ? AND ${column} = ?`,
-    )
-    .get(category, window) as { total: number };
+  const row = prepareCached(
+    db,
+    `SELECT COALESCE(SUM(amount_cents), 0) as total FROM spend_tracking WHERE category = ? AND ${column} = ?`,
+  ).get(category, window) as { total: number };
   return row.total;
 }
 
@@ -759,15 +786,13 @@ export function pruneSpendRecords(db: DatabaseType, olderThan: string): number {
 // ─── Heartbeat Schedule Helpers (Phase 1.1) ─────────────────────
 
 export function getHeartbeatSchedule(db: DatabaseType): HeartbeatScheduleRow[] {
-  const rows = db
-    .prepare("SELECT * FROM heartbeat_schedule ORDER BY priority ASC")
+  const rows = prepareCached(db, "SELECT * FROM heartbeat_schedule ORDER BY priority ASC")
     .all() as any[];
   return rows.map(deserializeHeartbeatScheduleRow);
 }
 
 export function getHeartbeatTask(db: DatabaseType, taskName: string): HeartbeatScheduleRow | undefined {
-  const row = db
-    .prepare("SELECT * FROM heartbeat_schedule WHERE task_name = ?")
+  const row = prepareCached(db, "SELECT * FROM heartbeat_schedule WHERE task_name = ?")
     .get(taskName) as any | undefined;
   return row ? deserializeHeartbeatScheduleRow(row) : undefined;
 }
@@ -801,11 +826,42 @@ export function updateHeartbeatSchedule(
   setClauses.push("updated_at = datetime('now')");
   params.push(taskName);
 
-  db.prepare(
+  // The built SQL string doubles as the cache key: scheduler callers update
+  // the same few column sets over and over, so each shape is prepared once.
+  prepareCached(
+    db,
     `UPDATE heartbeat_schedule SET ${setClauses.join(", ")} WHERE task_name = ?`,
   ).run(...params);
 }
 
+/**
+ * Record a completed task run in one statement. Counters are bumped
+ * SQL-side (run_count = run_count + 1) so no prior SELECT is needed and
+ * concurrent schedulers cannot lose increments. A null error marks
+ * success and clears any pending retry.
+ */
+export function recordHeartbeatRun(
+  db: DatabaseType,
+  taskName: string,
+  lastRunAt: string,
+  result: string,
+  error: string | null,
+): void {
+  if (error === null) {
+    prepareCached(
+      db,
+      `UPDATE heartbeat_schedule SET last_run_at = ?, next_run_at = NULL, last_result = ?, last_error = NULL,
+       run_count = run_count + 1, updated_at = datetime('now') WHERE task_name = ?`,
+    ).run(lastRunAt, result, taskName);
+  } else {
+    prepareCached(
+      db,
+      `UPDATE heartbeat_schedule SET last_run_at = ?, last_result = ?, last_error = ?,
+       run_count = run_count + 1, fail_count = fail_count + 1, updated_at = datetime('now') WHERE task_name = ?`,
+    ).run(lastRunAt, result, error, taskName);
+  }
+}
+
 export function upsertHeartbeatSchedule(db: DatabaseType, row: HeartbeatScheduleRow): void {
   db.prepare(
     `INSERT OR REPLACE INTO heartbeat_schedule
@@ -835,7 +891,8 @@ export function upsertHeartbeatSchedule(db: DatabaseType, row: HeartbeatSchedule
 // ─── Heartbeat History Helpers (Phase 1.1) ──────────────────────
 
 export function insertHeartbeatHistory(db: DatabaseType, entry: HeartbeatHistoryRow): void {
-  db.prepare(
+  prepareCached(
+    db,
     `INSERT INTO heartbeat_history (id, task_name, started_at, completed_at, result, duration_ms, error, idempotency_key)
      VALUES (?, ?, ?, ?, ?, ?, ?, ?)`,
   ).run(
@@ -863,7 +920,8 @@ export function getHeartbeatHistory(db: DatabaseType, taskName: string, limit =
 
 export function acquireTaskLease(db: DatabaseType, taskName: string, owner: string, ttlMs: number): boolean {
   const expiresAt = new Date(Date.now() + ttlMs).toISOString();
-  const result = db.prepare(
+  const result = prepareCached(
+    db,
     `UPDATE heartbeat_schedule
      SET lease_owner = ?, lease_expires_at = ?, updated_at = datetime('now')
      WHERE task_name = ?
@@ -873,7 +931,8 @@ export function acquireTaskLease(db: DatabaseType, taskName: string, owner: stri
 }
 
 export function releaseTaskLease(db: DatabaseType, taskName: string, owner: string): void {
-  db.prepare(
+  prepareCached(
+    db,
     `UPDATE heartbeat_schedule
      SET lease_owner = NULL, lease_expires_at = NULL, updated_at = datetime('now')
      WHERE task_name = ? AND lease_owner = ?`,
@@ -881,7 +940,8 @@ export function releaseTaskLease(db: DatabaseType, taskName: string, owner: stri
 }
 
 export function clearExpiredLeases(db: DatabaseType): number {
-  const result = db.prepare(
+  const result = prepareCached(
+    db,
     `UPDATE heartbeat_schedule
      SET lease_owner = NULL, lease_expires_at = NULL, updated_at = datetime('now')
      WHERE lease_expires_at IS NOT NULL AND lease_expires_at < datetime('now')`,
@@ -892,13 +952,15 @@ export function clearExpiredLeases(db: DatabaseType): number {
 // ─── Wake Event Helpers (Phase 1.1) ─────────────────────────────
 
 export function insertWakeEvent(db: DatabaseType, source: string, reason: string, payload?: object): void {
-  db.prepare(
+  prepareCached(
+    db,
     "INSERT INTO wake_events (source, reason, payload) VALUES (?, ?, ?)",
   ).run(source, reason, JSON.stringify(payload ?? {}));
 }
 
 export function consumeNextWakeEvent(db: DatabaseType): WakeEventRow | undefined {
-  const row = db.prepare(
+  const row = prepareCached(
+    db,
     `UPDATE wake_events
      SET consumed_at = datetime('now')
      WHERE id = (SELECT id FROM wake_events WHERE consumed_at IS NULL ORDER BY id ASC LIMIT 1)
@@ -928,7 +990,8 @@ export function pruneStaleKV(db: DatabaseType, prefix: string, retentionDays: nu
 export function insertDedupKey(db: DatabaseType, key: string, taskName: string, ttlMs: number): boolean {
   const expiresAt = new Date(Date.now() + ttlMs).toISOString();
   try {
-    db.prepare(
+    prepareCached(
+      db,
       "INSERT INTO heartbeat_dedup (dedup_key, task_name, expires_at) VALUES (?, ?, ?)",
     ).run(key, taskName, expiresAt);
     return true;
@@ -940,14 +1003,16 @@ export function insertDedupKey(db: DatabaseType, key: string, taskName: string,
 }
 
 export function pruneExpiredDedupKeys(db: DatabaseType): number {
-  const result = db.prepare(
+  const result = prepareCached(
+    db,
     "DELETE FROM heartbeat_dedup WHERE expires_at < datetime('now')",
   ).run();
   return result.changes;
 }
 
 export function isDeduplicated(db: DatabaseType, key: string): boolean {
-  const row = db.prepare(
+  const row = prepareCached(
+    db,
     "SELECT 1 FROM heartbeat_dedup WHERE dedup_key = ? AND expires_at >= datetime('now')",
   ).get(key) as any | undefined;
   return !!row;
@@ -1351,7 +1416,9 @@ export function wmUpdate(db: DatabaseType, id: string, updates: Partial<WorkingM
   if (setClauses.length === 0) return;
   params.push(id);
   try {
-    db.prepare(`UPDATE working_memory SET ${setClauses.join(", ")} WHERE id = ?`).run(...params);
+    // Same trick as updateHeartbeatSchedule: the SQL string keys the
+    // statement cache, so each distinct column set is prepared once.
+    prepareCached(db, `UPDATE working_memory SET ${setClauses.join(", ")} WHERE id = ?`).run(...params);
   } catch (error) {
     logger.error("wmUpdate failed", error instanceof Error ? error : undefined);
   }
@@ -1634,7 +1701,8 @@ function deserializeRelationshipRow(row: any): RelationshipMemoryEntry {
 
 export function inferenceInsertCost(db: DatabaseType, row: Omit<InferenceCostRow, "id" | "createdAt">): string {
   const id = ulid();
-  db.prepare(
+  prepareCached(
+    db,
     `INSERT INTO inference_costs (id, session_id, turn_id, model, provider, input_tokens, output_tokens, cost_cents, latency_ms, tier, task_type, cache_hit)
      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
   ).run(
@@ -1661,6 +1729,14 @@ export function inferenceGetSessionCosts(db: DatabaseType, sessionId: string): I
   return rows.map(deserializeInferenceCostRow);
 }
 
+export function inferenceGetSessionCostTotal(db: DatabaseType, sessionId: string): number {
+  const row = prepareCached(
+    db,
+    "SELECT COALESCE(SUM(cost_cents), 0) as total FROM inference_costs WHERE session_id = ?",
+  ).get(sessionId) as { total: number };
+  return row.total;
+}
+
 export function inferenceGetDailyCost(db: DatabaseType, date?: string): number {
   const targetDate = date || new Date().toISOString().slice(0, 10);
   // Compute the next day to use as exclusive upper bound, avoiding the off-by-one
@@ -1668,11 +1744,10 @@ export function inferenceGetDailyCost(db: DatabaseType, date?: string): number {
   const d = new Date(targetDate + "T00:00:00Z");
   d.setUTCDate(d.getUTCDate() + 1);
   const nextDate = d.toISOString().slice(0, 10);
-  const row = db
-    .prepare(
-      "SELECT COALESCE(SUM(cost_cents), 0) as total FROM inference_costs WHERE created_at >= ? AND created_at < ?",
-    )
-    .get(`${targetDate} 00:00:00`, `${nextDate} 00:00:00`) as { total: number };
+  const row = prepareCached(
+    db,
+    "SELECT COALESCE(SUM(cost_cents), 0) as total FROM inference_costs WHERE created_at >= ? AND created_at < ?",
+  ).get(`${targetDate} 00:00:00`, `${nextDate} 00:00:00`) as { total: number };
   return row.total;
 }
 
@@ -1680,11 +1755,10 @@ export function inferenceGetHourlyCost(db: DatabaseType): number {
   const now = new Date();
   const pad = (n: number) => n.toString().padStart(2, "0");
   const hourStart = `${now.getUTCFullYear()}-${pad(now.getUTCMonth() + 1)}-${pad(now.getUTCDate())} ${pad(now.getUTCHours())}:00:00`;
-  const row = db
-    .prepare(
-      "SELECT COALESCE(SUM(cost_cents), 0) as total FROM inference_costs WHERE created_at >= ?",
-    )
-    .get(hourStart) as { total: number };
+  const row = prepareCached(
+    db,
+    "SELECT COALESCE(SUM(cost_cents), 0) as total FROM inference_costs WHERE created_at >= ?",
+  ).get(hourStart) as { total: number };
   return row.total;
 }
 
@@ -1750,18 +1824,22 @@ export function modelRegistryGetAll(db: DatabaseType): ModelRegistryRow[] {
 
 export function modelRegistryGetAvailable(db: DatabaseType, tierMinimum?: string): ModelRegistryRow[] {
   if (tierMinimum) {
-    const tierOrder: Record<string, number> = { dead: 0, critical: 1, low_compute: 2, normal: 3, high: 4 };
+    const tierOrder: Record<string, number> = SURVIVAL_TIER_ORDER;
     const minOrder = tierOrder[tierMinimum] ?? 0;
-    const rows = db
-      .prepare("SELECT * FROM model_registry WHERE enabled = 1 ORDER BY model_id")
-      .all() as any[];
-    return rows
-      .map(deserializeModelRegistryRow)
-      .filter((r) => (tierOrder[r.tierMinimum] ?? 0) <= minOrder);
+    // Filter in SQL so rows above the tier are never fetched or deserialized.
+    // Unknown tier_minimum values rank as 0, matching the old JS fallback.
+    const allowedTiers = Object.keys(tierOrder).filter((t) => tierOrder[t] <= minOrder);
+    const placeholders = allowedTiers.map(() => "?").join(", ");
+    const rows = prepareCached(
+      db,
+      `SELECT * FROM model_registry WHERE enabled = 1 AND (tier_minimum IN (${placeholders}) OR tier_minimum NOT IN ('dead', 'critical', 'low_compute', 'normal', 'high')) ORDER BY model_id`,
+    ).all(...allowedTiers) as any[];
+    return rows.map(deserializeModelRegistryRow);
   }
-  const rows = db
-    .prepare("SELECT * FROM model_registry WHERE enabled = 1 ORDER BY model_id")
-    .all() as any[];
+  const rows = prepareCached(
+    db,
+    "SELECT * FROM model_registry WHERE enabled = 1 ORDER BY model_id",
+  ).all() as any[];
   return rows.map(deserializeModelRegistryRow);
 }
 
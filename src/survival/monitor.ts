@@ -32,26 +32,16 @@ export async function checkResources(
   conway: ConwayClient,
   db: AutomatonDatabase,
 ): Promise<ResourceStatus> {
-  // Check credits
-  let creditsCents = 0;
-  try {
-    creditsCents = await conway.getCreditsBalance();
-  } catch {}
-
-  // Check USDC
-  let usdcBalance = 0;
-  try {
-    usdcBalance = await getUsdcBalance(identity.address);
-  } catch {}
-
-  // Check sandbox health
-  let sandboxHealthy = true;
-  try {
-    const result = await conway.exec("echo ok", 5000);
-    sandboxHealthy = result.exitCode === 0;
-  } catch {
-    sandboxHealthy = false;
-  }
+  // The three checks are independent network calls — run them concurrently
+  // so the monitor pass costs one round trip instead of three in sequence.
+  const [creditsCents, usdcBalance, sandboxHealthy] = await Promise.all([
+    conway.getCreditsBalance().catch(() => 0),
+    getUsdcBalance(identity.address).catch(() => 0),
+    conway
+      .exec("echo ok", 5000)
+      .then((result) => result.exitCode === 0)
+      .catch(() => false),
+  ]);
 
   const financial: FinancialState = {
     creditsCents,
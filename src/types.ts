@@ -217,6 +217,17 @@ export const SURVIVAL_THRESHOLDS = {
   dead: -1, // negative balance = truly dead
 } as const;
 
+// Ordinal ranking of survival tiers, lowest to highest. Shared by every
+// "does the current tier meet this minimum?" comparison so the ordering
+// lives in exactly one place.
+export const SURVIVAL_TIER_ORDER: Record<SurvivalTier, number> = {
+  dead: 0,
+  critical: 1,
+  low_compute: 2,
+  normal: 3,
+  high: 4,
+};
+
 export interface Transaction {
   id: string;
   type: TransactionType;